@@ -0,0 +1,28 @@
+import unittest
+
+from harnessViterbi import ENGINES, MODELS, run_harness, summarize
+
+
+class TestHarness(unittest.TestCase):
+    def test_engines_agree(self):
+        for seed, K, M in [(0, 2, 2), (1, 3, 5), (2, 4, 4), (3, 6, 3)]:
+            records = run_harness(seed=seed, windows=3, K=K, M=M, T=150)
+
+            self.assertEqual(len(records), len(MODELS) * 3 * len(ENGINES))
+            for record in records:
+                self.assertTrue(record['match'], record)
+
+    def test_summary(self):
+        records = run_harness(seed=0, windows=2, K=3, M=3, T=50)
+        summary = summarize(records)
+
+        self.assertEqual(set(summary), {(model, engine) for model in MODELS for engine in ENGINES})
+        for (model, engine), entry in summary.items():
+            self.assertEqual(entry['mismatches'], 0)
+            self.assertGreaterEqual(entry['time'], 0)
+            self.assertGreater(entry['nodes'], 0)
+        self.assertEqual(summary[('dense', 'standard')]['nodes'], 3 * 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
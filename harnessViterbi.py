@@ -0,0 +1,214 @@
+import random
+import time
+
+from onlineViterbi import OnlineViterbi
+from standardViterbi import StandardViterbi
+
+
+class ModelGenerator:
+    """
+    Seeded generators for randomized hidden Markov models.
+
+    Every generator returns a tuple (A, E, initial) of row-stochastic
+    plain Python lists, the same layout consumed by the Viterbi engines.
+    """
+
+    @staticmethod
+    def normalize(row):
+        total = sum(row)
+        return [value / total for value in row]
+
+    @staticmethod
+    def dense(rng, K, M):
+        """
+        Fully connected model with strictly positive probabilities.
+        """
+        A = [ModelGenerator.normalize([rng.random() + 0.01 for _ in range(K)]) for _ in range(K)]
+        E = [ModelGenerator.normalize([rng.random() + 0.01 for _ in range(M)]) for _ in range(K)]
+        initial = ModelGenerator.normalize([rng.random() + 0.01 for _ in range(K)])
+        return A, E, initial
+
+    @staticmethod
+    def banded(rng, K, M, width=1):
+        """
+        Model whose transitions only reach states within `width` of the
+        current one (cyclically), leaving the rest of A at zero.
+        """
+        A = [[0.0] * K for _ in range(K)]
+        for i in range(K):
+            for d in range(-width, width + 1):
+                A[i][(i + d) % K] = rng.random() + 0.01
+            A[i] = ModelGenerator.normalize(A[i])
+        E = [ModelGenerator.normalize([rng.random() + 0.01 for _ in range(M)]) for _ in range(K)]
+        initial = ModelGenerator.normalize([rng.random() + 0.01 for _ in range(K)])
+        return A, E, initial
+
+    @staticmethod
+    def near_deterministic(rng, K, M, epsilon=1e-3):
+        """
+        Model where each state almost surely moves to a fixed successor and
+        almost surely emits a fixed symbol.
+        """
+        successors = list(range(K))
+        rng.shuffle(successors)
+        A = [[epsilon] * K for _ in range(K)]
+        E = [[epsilon] * M for _ in range(K)]
+        for i in range(K):
+            A[i][successors[i]] = 1.0
+            E[i][rng.randrange(M)] = 1.0
+            A[i] = ModelGenerator.normalize(A[i])
+            E[i] = ModelGenerator.normalize(E[i])
+        initial = ModelGenerator.normalize([rng.random() + 0.01 for _ in range(K)])
+        return A, E, initial
+
+    @staticmethod
+    def tie_heavy(rng, K, M):
+        """
+        Model built from a handful of repeated probability levels so that
+        many candidate paths score exactly the same.
+        """
+        levels = [0.0, 1.0, 2.0]
+        A = []
+        for _ in range(K):
+            row = [rng.choice(levels) for _ in range(K)]
+            row[rng.randrange(K)] = 2.0
+            A.append(ModelGenerator.normalize(row))
+        E = []
+        for _ in range(K):
+            row = [rng.choice(levels) for _ in range(M)]
+            row[rng.randrange(M)] = 2.0
+            E.append(ModelGenerator.normalize(row))
+        initial = [1.0 / K] * K
+        return A, E, initial
+
+    @staticmethod
+    def observations(rng, T, A, E, initial):
+        """
+        Samples an observation sequence of length T from the model.
+        """
+        K, M = len(A), len(E[0])
+        observations = [0] * T
+        state = rng.choices(range(K), weights=initial)[0]
+        for t in range(T):
+            state = rng.choices(range(K), weights=A[state])[0]
+            observations[t] = rng.choices(range(M), weights=E[state])[0]
+        return observations
+
+
+def run_standard(K, T, observations, initial, A, E):
+    """
+    Decodes one window with StandardViterbi.
+
+    Returns:
+        tuple: (decoded path, number of stored trellis nodes).
+    """
+    standard_viterbi = StandardViterbi(K, T)
+    standard_viterbi.viterbi(observations, initial, A, E)
+    return standard_viterbi.optimalPath, K * T
+
+
+def run_online(K, T, observations, initial, A, E):
+    """
+    Decodes one window with OnlineViterbi, feeding one observation at a time.
+
+    Returns:
+        tuple: (decoded path, peak size of the survivor node list).
+    """
+    online_viterbi = OnlineViterbi(K, T)
+    online_viterbi.initialization(0, initial)
+    peak_nodes = 0
+    for t in range(T):
+        online_viterbi.update(t, observations[t], A, E)
+        peak_nodes = max(peak_nodes, online_viterbi.node_list.size)
+    online_viterbi.traceback_last_part()
+    return online_viterbi.decoded_stream, peak_nodes
+
+
+REFERENCE = 'standard'
+
+# Engines under comparison; each maps (K, T, observations, initial, A, E) to
+# (path, nodes). New backends register here to be checked against REFERENCE.
+ENGINES = {
+    'standard': run_standard,
+    'online': run_online,
+}
+
+MODELS = {
+    'dense': ModelGenerator.dense,
+    'banded': ModelGenerator.banded,
+    'near_deterministic': ModelGenerator.near_deterministic,
+    'tie_heavy': ModelGenerator.tie_heavy,
+}
+
+
+def run_harness(seed=0, windows=5, K=4, M=4, T=200, engines=None, models=None):
+    """
+    Runs every engine on `windows` random windows of every model family.
+
+    Args:
+        seed (int): Seed for the random number generator.
+        windows (int): Number of windows per model family.
+        K (int): Number of Hidden States.
+        M (int): Number of Observation Symbols.
+        T (int): Number of Time Instances per window.
+        engines (dict): Engines to compare, defaults to ENGINES.
+        models (dict): Model generators to use, defaults to MODELS.
+
+    Returns:
+        list: One record per (model, window, engine) with keys 'model',
+        'window', 'engine', 'time', 'nodes' and 'match'.
+    """
+    engines = ENGINES if engines is None else engines
+    models = MODELS if models is None else models
+    rng = random.Random(seed)
+    records = []
+
+    for model_name, generator in models.items():
+        for window in range(windows):
+            A, E, initial = generator(rng, K, M)
+            observations = ModelGenerator.observations(rng, T, A, E, initial)
+
+            reference_path, _ = ENGINES[REFERENCE](K, T, observations, initial, A, E)
+            for engine_name, engine in engines.items():
+                start_time = time.perf_counter()
+                path, nodes = engine(K, T, observations, initial, A, E)
+                end_time = time.perf_counter()
+
+                records.append({
+                    'model': model_name,
+                    'window': window,
+                    'engine': engine_name,
+                    'time': end_time - start_time,
+                    'nodes': nodes,
+                    'match': list(path) == list(reference_path),
+                })
+
+    return records
+
+
+def summarize(records):
+    """
+    Aggregates harness records per (model, engine).
+
+    Returns:
+        dict: (model, engine) -> {'time', 'nodes', 'mismatches'} with total
+        time, peak node count and number of windows that disagreed with
+        the reference engine.
+    """
+    summary = {}
+    for record in records:
+        key = (record['model'], record['engine'])
+        entry = summary.setdefault(key, {'time': 0.0, 'nodes': 0, 'mismatches': 0})
+        entry['time'] += record['time']
+        entry['nodes'] = max(entry['nodes'], record['nodes'])
+        entry['mismatches'] += 0 if record['match'] else 1
+    return summary
+
+
+if __name__ == '__main__':
+    records = run_harness(seed=0, windows=10, K=4, M=4, T=500)
+
+    print("{:<20}{:<12}{:>12}{:>10}{:>12}".format('model', 'engine', 'time(s)', 'nodes', 'mismatches'))
+    for (model_name, engine_name), entry in summarize(records).items():
+        print("{:<20}{:<12}{:>12.6f}{:>10}{:>12}".format(model_name, engine_name, entry['time'],
+                                                        entry['nodes'], entry['mismatches']))